@@ -31,7 +31,7 @@ from .expr import ExprNode
 from .frame import H2OFrame
 from .grid.grid_search import H2OGridSearch
 from .job import H2OJob
-from .model.model_base import ModelBase
+from .model.model_base import ModelBase, _download_with_genmodel_jar
 from .transforms.decomposition import H2OPCA
 from .transforms.decomposition import H2OSVD
 from .utils.debugging import *  # NOQA
@@ -819,10 +819,9 @@ def download_pojo(model, path="", get_jar=True):
         print(java_code)
         return None
     else:
-        filename = api("GET /3/Models.java/%s" % model.model_id, save_to=path)
         if get_jar:
-            api("GET /3/h2o-genmodel.jar", save_to=os.path.join(path, "h2o-genmodel.jar"))
-        return filename
+            return _download_with_genmodel_jar("GET /3/Models.java/%s" % model.model_id, path)
+        return api("GET /3/Models.java/%s" % model.model_id, save_to=path)
 
 
 def download_csv(data, filename):
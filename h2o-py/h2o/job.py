@@ -42,6 +42,7 @@ class H2OJob(object):
         self._job_type = job_type
         self._polling = False
         self._poll_count = 10**10
+        self._poll_delay = 0.1  # back-off state for polling without a progress bar; doubled on each poll
 
 
     def poll(self):
@@ -104,7 +105,14 @@ class H2OJob(object):
         if self.status == "DONE": self.progress = 1
         if self.status == "FAILED": raise StopIteration("failed")
         if self.status == "CANCELLED": raise StopIteration("cancelled by the server")
-        return self.progress
+        if H2OJob.__PROGRESS_BAR__:
+            return self.progress
+        # With the progress bar hidden there is nothing to redraw between polls, so instead of following the
+        # bar's rendering-driven schedule we back off exponentially (capped at the bar's maximum check
+        # interval). The server has no long-poll variant of GET /3/Jobs, so issuing fewer, sparser status
+        # requests is the best way to keep long jobs from flooding the /3/Jobs handler.
+        self._poll_delay = min(self._poll_delay * 2, ProgressBar.MAX_PROGRESS_CHECK_INTERVAL)
+        return self.progress, self._poll_delay
 
     def __repr__(self):
         if self.status in {"CREATED", "RUNNING"}:
@@ -8,9 +8,14 @@ This module implements the base model class.  All model things inherit from this
 from __future__ import absolute_import, division, print_function, unicode_literals
 
 import os
-import traceback
+import sys
 import warnings
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:  # Python 2 without the `futures` backport installed
+    ThreadPoolExecutor = None
+
 import h2o
 from h2o.exceptions import H2OValueError
 from h2o.job import H2OJob
@@ -20,6 +25,12 @@ from h2o.utils.compatibility import viewitems
 from h2o.utils.shared_utils import can_use_pandas
 from h2o.utils.typechecks import I, assert_is_type
 
+# Parameters whose actual values are server objects; ``actual_params`` reports just the named field for these.
+_ACTUAL_PARAMS_SELECT = {"model_id": "name",
+                         "response_column": "column_name",
+                         "training_frame": "name",
+                         "validation_frame": "name"}
+
 
 class ModelBase(backwards_compatible()):
     """Base class for all models."""
@@ -29,6 +40,7 @@ class ModelBase(backwards_compatible()):
         super(ModelBase, self).__init__()
         self._id = None
         self._model_json = None
+        self._output_cache = None
         self._metrics_class = None
         self._is_xvalidated = False
         self._xval_keys = None
@@ -39,6 +51,19 @@ class ModelBase(backwards_compatible()):
         self._job = None  # used when _future is True
 
 
+    @property
+    def _model_json(self):
+        return self.__model_json
+
+    @_model_json.setter
+    def _model_json(self, model_json):
+        # Invalidate everything derived from the previous model json (see ``_get_metrics`` / ``_metric``).
+        self.__model_json = model_json
+        self._output_cache = None
+        self._metric_cache = {}
+        self._scoring_history_cache = None
+
+
     @property
     def model_id(self):
         """Model identifier."""
@@ -59,9 +84,9 @@ class ModelBase(backwards_compatible()):
         :returns: A dictionary of parameters used to build this model.
         """
         params = {}
-        for p in self.parms:
-            params[p] = {"default": self.parms[p]["default_value"],
-                         "actual": self.parms[p]["actual_value"]}
+        for p, v in viewitems(self.parms):
+            params[p] = {"default": v["default_value"],
+                         "actual": v["actual_value"]}
         return params
 
     @property
@@ -72,8 +97,8 @@ class ModelBase(backwards_compatible()):
         :return: A dictionary of default parameters for the model
         """
         params = {}
-        for p in self.parms:
-            params[p] = self.parms[p]["default_value"]
+        for p, v in viewitems(self.parms):
+            params[p] = v["default_value"]
         return params
 
     @property
@@ -83,16 +108,13 @@ class ModelBase(backwards_compatible()):
 
         :return: A dictionary of actual parameters for the model
         """
-        params_to_select = {'model_id':'name', \
-                            'response_column':'column_name', \
-                            'training_frame': 'name', \
-                            'validation_frame':'name'}
         params = {}
-        for p in self.parms:
-            if p in params_to_select.keys():
-                params[p] = self.parms[p]["actual_value"].get(params_to_select[p], None)
+        for p, v in viewitems(self.parms):
+            actual_value = v["actual_value"]
+            if p in _ACTUAL_PARAMS_SELECT:
+                params[p] = actual_value.get(_ACTUAL_PARAMS_SELECT[p], None)
             else:
-                params[p] = self.parms[p]["actual_value"]
+                params[p] = actual_value
         return params
 
     @property
@@ -116,8 +138,8 @@ class ModelBase(backwards_compatible()):
 
     def __repr__(self):
         # PUBDEV-2278: using <method>? from IPython caused everything to dump
-        stk = traceback.extract_stack()
-        if not ("IPython" in stk[-2][0] and "info" == stk[-2][2]):
+        caller = sys._getframe(1).f_code
+        if not ("IPython" in caller.co_filename and "info" == caller.co_name):
             self.show()
         return ""
 
@@ -145,10 +167,28 @@ class ModelBase(backwards_compatible()):
         :returns: A new H2OFrame of predictions.
         """
         if not isinstance(test_data, h2o.H2OFrame): raise ValueError("test_data must be an instance of H2OFrame")
-        j = H2OJob(h2o.api("POST /4/Predictions/models/%s/frames/%s" % (self.model_id, test_data.frame_id)),
-                   self._model_json['algo'] + " prediction")
-        j.poll()
-        return h2o.get_frame(j.dest_key)
+        return self.predict_batch([test_data])[0]
+
+
+    def predict_batch(self, test_data):
+        """
+        Predict on several datasets at once.
+
+        All prediction jobs are submitted to the server before any of them is polled for completion. This lets
+        the server work on the predictions concurrently and pays the HTTP round-trip latency only once, instead
+        of once per frame -- useful when scoring many small frames in a loop.
+
+        :param test_data: A list of H2OFrames on which to make predictions.
+
+        :returns: A list of new H2OFrames of predictions, one per input frame, in the same order.
+        """
+        assert_is_type(test_data, [h2o.H2OFrame])
+        jobs = [H2OJob(h2o.api("POST /4/Predictions/models/%s/frames/%s" % (self.model_id, fr.frame_id)),
+                       self._model_json['algo'] + " prediction")
+                for fr in test_data]
+        for j in jobs:
+            j.poll()
+        return [h2o.get_frame(j.dest_key) for j in jobs]
 
 
     def is_cross_validated(self):
@@ -205,7 +245,7 @@ class ModelBase(backwards_compatible()):
         :returns: an H2OFrame which represents the weight matrix identified by matrix_id
         """
         num_weight_matrices = len(self._model_json['output']['weights'])
-        if matrix_id not in list(range(num_weight_matrices)):
+        if not (0 <= matrix_id < num_weight_matrices):
             raise ValueError(
                 "Weight matrix does not exist. Model has {0} weight matrices (0-based indexing), but matrix {1} "
                 "was requested.".format(num_weight_matrices, matrix_id))
@@ -221,7 +261,7 @@ class ModelBase(backwards_compatible()):
         :returns: an H2OFrame which represents the bias vector identified by vector_id
         """
         num_bias_vectors = len(self._model_json['output']['biases'])
-        if vector_id not in list(range(num_bias_vectors)):
+        if not (0 <= vector_id < num_bias_vectors):
             raise ValueError(
                 "Bias vector does not exist. Model has {0} bias vectors (0-based indexing), but vector {1} "
                 "was requested.".format(num_bias_vectors, vector_id))
@@ -283,11 +323,8 @@ class ModelBase(backwards_compatible()):
             res = h2o.api("POST /3/ModelMetrics/models/%s/frames/%s" % (self.model_id, test_data.frame_id))
 
             # FIXME need to do the client-side filtering...  (PUBDEV-874)
-            raw_metrics = None
-            for mm in res["model_metrics"]:
-                if mm["frame"] is not None and mm["frame"]["name"] == test_data.frame_id:
-                    raw_metrics = mm
-                    break
+            mm_by_frame = {mm["frame"]["name"]: mm for mm in res["model_metrics"] if mm["frame"] is not None}
+            raw_metrics = mm_by_frame.get(test_data.frame_id)
             return self._metrics_class(raw_metrics, algo=self._model_json["algo"])
 
 
@@ -297,9 +334,14 @@ class ModelBase(backwards_compatible()):
 
         :returns: The score history as an H2OTwoDimTable or a Pandas DataFrame.
         """
+        if self._scoring_history_cache is not None:
+            return self._scoring_history_cache
         model = self._model_json["output"]
         if "scoring_history" in model and model["scoring_history"] is not None:
-            return model["scoring_history"].as_data_frame()
+            # The two-dim-table -> data-frame conversion is row-by-row Python work, so keep the result around
+            # for repeated calls; the cache is dropped whenever ``_model_json`` is reassigned.
+            self._scoring_history_cache = model["scoring_history"].as_data_frame()
+            return self._scoring_history_cache
         print("No score history for this model")
 
 
@@ -344,20 +386,11 @@ class ModelBase(backwards_compatible()):
         self.summary()
 
         print()
-        # training metrics
-        tm = model["training_metrics"]
-        if tm: tm.show()
-        vm = model["validation_metrics"]
-        if vm: vm.show()
-        xm = model["cross_validation_metrics"]
-        if xm: xm.show()
-        xms = model["cross_validation_metrics_summary"]
-        if xms: xms.show()
-
-        if "scoring_history" in model and model["scoring_history"]:
-            model["scoring_history"].show()
-        if "variable_importances" in model and model["variable_importances"]:
-            model["variable_importances"].show()
+        # metrics and tables, in display order; ``get`` avoids the "key in model and model[key]" double lookups
+        for key in ("training_metrics", "validation_metrics", "cross_validation_metrics",
+                    "cross_validation_metrics_summary", "scoring_history", "variable_importances"):
+            tbl = model.get(key)
+            if tbl: tbl.show()
 
 
     def varimp(self, use_pandas=False):
@@ -369,12 +402,12 @@ class ModelBase(backwards_compatible()):
         :returns: A list or Pandas DataFrame.
         """
         model = self._model_json["output"]
-        if "variable_importances" in list(model.keys()) and model["variable_importances"]:
+        if "variable_importances" in model and model["variable_importances"]:
             vals = model["variable_importances"].cell_values
             header = model["variable_importances"].col_header
             if use_pandas and can_use_pandas():
                 import pandas
-                return pandas.DataFrame(vals, columns=header)
+                return pandas.DataFrame.from_records(vals, columns=header)
             else:
                 return vals
         else:
@@ -476,7 +509,7 @@ class ModelBase(backwards_compatible()):
         tbl = self._model_json["output"]["coefficients_table"]
         if tbl is None:
             return None
-        return {name: coef for name, coef in zip(tbl['names'], tbl['coefficients'])}
+        return dict(zip(tbl['names'], tbl['coefficients']))
 
     def coef_norm(self):
         """Return coefficients fitted on the standardized data (requires standardize = True,
@@ -484,7 +517,7 @@ class ModelBase(backwards_compatible()):
         tbl = self._model_json["output"]["coefficients_table"]
         if tbl is None:
             return None
-        return {name: coef for name, coef in zip(tbl['names'], tbl['standardized_coefficients'])}
+        return dict(zip(tbl['names'], tbl['standardized_coefficients']))
 
 
     def r2(self, train=False, valid=False, xval=False):
@@ -505,10 +538,7 @@ class ModelBase(backwards_compatible()):
 
         :returns: The R^2 for this regression model.
         """
-        tm = ModelBase._get_metrics(self, train, valid, xval)
-        m = {}
-        for k, v in viewitems(tm): m[k] = None if v is None else v.r2()
-        return list(m.values())[0] if len(m) == 1 else m
+        return self._metric("r2", train, valid, xval)
 
 
     def mse(self, train=False, valid=False, xval=False):
@@ -530,10 +560,7 @@ class ModelBase(backwards_compatible()):
 
         :returns: The MSE for this regression model.
         """
-        tm = ModelBase._get_metrics(self, train, valid, xval)
-        m = {}
-        for k, v in viewitems(tm): m[k] = None if v is None else v.mse()
-        return list(m.values())[0] if len(m) == 1 else m
+        return self._metric("mse", train, valid, xval)
 
 
     def rmse(self, train=False, valid=False, xval=False):
@@ -557,10 +584,7 @@ class ModelBase(backwards_compatible()):
         -------
           The RMSE for this regression model.
         """
-        tm = ModelBase._get_metrics(self, train, valid, xval)
-        m = {}
-        for k, v in viewitems(tm): m[k] = None if v is None else v.rmse()
-        return list(m.values())[0] if len(m) == 1 else m
+        return self._metric("rmse", train, valid, xval)
 
 
     def mae(self, train=False, valid=False, xval=False):
@@ -584,10 +608,7 @@ class ModelBase(backwards_compatible()):
         -------
           The MAE for this regression model.
         """
-        tm = ModelBase._get_metrics(self, train, valid, xval)
-        m = {}
-        for k, v in viewitems(tm): m[k] = None if v is None else v.mae()
-        return list(m.values())[0] if len(m) == 1 else m
+        return self._metric("mae", train, valid, xval)
 
     def rmsle(self, train=False, valid=False, xval=False):
         """
@@ -610,10 +631,7 @@ class ModelBase(backwards_compatible()):
         -------
           The rmsle for this regression model.
         """
-        tm = ModelBase._get_metrics(self, train, valid, xval)
-        m = {}
-        for k, v in viewitems(tm): m[k] = None if v is None else v.rmsle()
-        return list(m.values())[0] if len(m) == 1 else m
+        return self._metric("rmsle", train, valid, xval)
 
 
     def logloss(self, train=False, valid=False, xval=False):
@@ -630,10 +648,7 @@ class ModelBase(backwards_compatible()):
 
         :returns: The Log Loss for this binomial model.
         """
-        tm = ModelBase._get_metrics(self, train, valid, xval)
-        m = {}
-        for k, v in viewitems(tm): m[k] = None if v is None else v.logloss()
-        return list(m.values())[0] if len(m) == 1 else m
+        return self._metric("logloss", train, valid, xval)
 
 
     def mean_residual_deviance(self, train=False, valid=False, xval=False):
@@ -650,10 +665,7 @@ class ModelBase(backwards_compatible()):
 
         :returns: The Mean Residual Deviance for this regression model.
         """
-        tm = ModelBase._get_metrics(self, train, valid, xval)
-        m = {}
-        for k, v in viewitems(tm): m[k] = None if v is None else v.mean_residual_deviance()
-        return list(m.values())[0] if len(m) == 1 else m
+        return self._metric("mean_residual_deviance", train, valid, xval)
 
 
     def auc(self, train=False, valid=False, xval=False):
@@ -670,10 +682,7 @@ class ModelBase(backwards_compatible()):
 
         :returns: The AUC.
         """
-        tm = ModelBase._get_metrics(self, train, valid, xval)
-        m = {}
-        for k, v in viewitems(tm): m[k] = None if v is None else v.auc()
-        return list(m.values())[0] if len(m) == 1 else m
+        return self._metric("auc", train, valid, xval)
 
 
     def aic(self, train=False, valid=False, xval=False):
@@ -690,10 +699,7 @@ class ModelBase(backwards_compatible()):
 
         :returns: The AIC.
         """
-        tm = ModelBase._get_metrics(self, train, valid, xval)
-        m = {}
-        for k, v in viewitems(tm): m[k] = None if v is None else v.aic()
-        return list(m.values())[0] if len(m) == 1 else m
+        return self._metric("aic", train, valid, xval)
 
 
     def gini(self, train=False, valid=False, xval=False):
@@ -710,10 +716,7 @@ class ModelBase(backwards_compatible()):
 
         :returns: The Gini Coefficient for this binomial model.
         """
-        tm = ModelBase._get_metrics(self, train, valid, xval)
-        m = {}
-        for k, v in viewitems(tm): m[k] = None if v is None else v.gini()
-        return list(m.values())[0] if len(m) == 1 else m
+        return self._metric("gini", train, valid, xval)
 
 
     def download_pojo(self, path="", get_genmodel_jar=False):
@@ -746,14 +749,33 @@ class ModelBase(backwards_compatible()):
             raise H2OValueError("MOJOs are currently supported for Distributed Random Forest, "
                                 "Gradient Boosting Machine, Deep Water, GLM and GLRM models only.")
         if get_genmodel_jar:
-            h2o.api("GET /3/h2o-genmodel.jar", save_to=os.path.join(path, "h2o-genmodel.jar"))
+            return _download_with_genmodel_jar("GET /3/Models/%s/mojo" % self.model_id, path)
         return h2o.api("GET /3/Models/%s/mojo" % self.model_id, save_to=path)
 
 
+    def _metric(self, name, train, valid, xval):
+        # Shared dispatcher behind the simple per-split accessors (r2, mse, auc, ...). The computed result is
+        # memoized per (metric, split) combination; the cache lives until ``_model_json`` is reassigned, so
+        # sweeps that query the same metrics over and over (e.g. AutoML leaderboards) hit the dict directly.
+        key = (name, train, valid, xval)
+        cache = self._metric_cache
+        if key in cache: return cache[key]
+        tm = ModelBase._get_metrics(self, train, valid, xval)
+        m = {k: None if v is None else getattr(v, name)() for k, v in viewitems(tm)}
+        res = list(m.values())[0] if len(m) == 1 else m
+        cache[key] = res
+        return res
+
+
     @staticmethod
     def _get_metrics(o, train, valid, xval):
+        # The "output" sub-dict is looked up once per model and memoized; pulling dozens of metrics in a row
+        # then bypasses the repeated ``_model_json["output"]`` indexing. The cache is dropped whenever
+        # ``_model_json`` is reassigned.
         # noinspection PyProtectedMember
-        output = o._model_json["output"]
+        output = o._output_cache
+        if output is None:
+            output = o._output_cache = o._model_json["output"]
         metrics = {}
         if train: metrics["train"] = output["training_metrics"]
         if valid: metrics["valid"] = output["validation_metrics"]
@@ -800,38 +822,49 @@ class ModelBase(backwards_compatible()):
 
             training_metric = "training_{}".format(metric)
             validation_metric = "validation_{}".format(metric)
+            import numpy as np
+            timestep_values = None
             if timestep == "duration":
-                dur_colname = "duration_{}".format(scoring_history["duration"][1].split()[1])
-                scoring_history[dur_colname] = [str(x).split()[0] for x in scoring_history["duration"]]
-                timestep = dur_colname
+                durations = scoring_history["duration"]
+                timestep = "duration_{}".format(durations[1].split()[1])  # label the axis with the time unit
+                if can_use_pandas():
+                    # One C-level split+cast pass instead of a str(x).split() call per row; parsing into a
+                    # local array also keeps the helper column out of the cached scoring-history frame.
+                    timestep_values = durations.str.split(n=1).str[0].astype(float).values
+                else:
+                    timestep_values = np.asarray([float(str(x).split()[0]) for x in durations])
 
             if can_use_pandas():
-                valid = validation_metric in list(scoring_history)
-                ylim = (scoring_history[[training_metric, validation_metric]].min().min(),
-                        scoring_history[[training_metric, validation_metric]].max().max()) if valid \
-                    else (scoring_history[training_metric].min(), scoring_history[training_metric].max())
+                # hashed lookup on the column Index; list(scoring_history) built a throwaway name list
+                valid = validation_metric in scoring_history.columns
             else:
                 valid = validation_metric in scoring_history.col_header
-                ylim = (min(min(scoring_history[[training_metric, validation_metric]])),
-                        max(max(scoring_history[[training_metric, validation_metric]]))) if valid \
-                    else (min(scoring_history[training_metric]), max(scoring_history[training_metric]))
-            if ylim[0] == ylim[1]: ylim = (0, 1)
+            # Pull each column into an ndarray once: every indexing of the data frame builds a fresh Series,
+            # and the old ylim computation indexed the metric columns twice (once for min, once for max).
+            if timestep_values is None:
+                timestep_values = np.asarray(scoring_history[timestep])
+            training_values = np.asarray(scoring_history[training_metric], dtype=np.float64)
+            lo, hi = np.nanmin(training_values), np.nanmax(training_values)
+            if valid:
+                validation_values = np.asarray(scoring_history[validation_metric], dtype=np.float64)
+                lo = min(lo, np.nanmin(validation_values))
+                hi = max(hi, np.nanmax(validation_values))
+            ylim = (0, 1) if lo == hi else (lo, hi)
 
             if valid:  # Training and validation scoring history
                 plt.xlabel(timestep)
                 plt.ylabel(metric)
                 plt.title("Scoring History")
                 plt.ylim(ylim)
-                plt.plot(scoring_history[timestep], scoring_history[training_metric], label="Training")
-                plt.plot(scoring_history[timestep], scoring_history[validation_metric], color="orange",
-                         label="Validation")
+                plt.plot(timestep_values, training_values, label="Training")
+                plt.plot(timestep_values, validation_values, color="orange", label="Validation")
                 plt.legend()
             else:  # Training scoring history only
                 plt.xlabel(timestep)
                 plt.ylabel(training_metric)
                 plt.title("Training Scoring History")
                 plt.ylim(ylim)
-                plt.plot(scoring_history[timestep], scoring_history[training_metric])
+                plt.plot(timestep_values, training_values)
 
         else:  # algo is not glm, deeplearning, drf, gbm
             raise H2OValueError("Plotting not implemented for this type of model")
@@ -883,10 +916,13 @@ class ModelBase(backwards_compatible()):
             if not plt: return
 
             fig, axs = plt.subplots(len(cols), squeeze=False, figsize=figsize)
+            # One call resolves factor-ness for every column at once, instead of a data[col].isfactor()
+            # server round-trip (plus a temporary one-column frame) per plotted column.
+            is_factor = dict(zip(data.names, data.isfactor()))
             for i, pp in enumerate(pps):
                 ## Check weather column was categorical or numeric
                 col=cols[i]
-                cat=data[col].isfactor()[0]
+                cat=is_factor[col]
                 if cat:
                     labels = pp[0]
                     x = range(len(labels))
@@ -931,14 +967,16 @@ class ModelBase(backwards_compatible()):
             self.std_coef_plot(num_of_features)
             return
 
+        import numpy as np
         # get the variable importances as a list of tuples, do not use pandas dataframe
         importances = self.varimp(use_pandas=False)
-        # features labels correspond to the first value of each tuple in the importances list
-        feature_labels = [tup[0] for tup in importances]
-        # relative importances correspond to the first value of each tuple in the importances list
-        scaled_importances = [tup[2] for tup in importances]
+        # transpose the rows once with C-level zip instead of one Python pass per extracted column;
+        # feature labels are the first column, scaled importances the third
+        columns = list(zip(*importances))
+        feature_labels = list(columns[0])
+        scaled_importances = list(columns[2])
         # specify bar centers on the y axis, but flip the order so largest bar appears at top
-        pos = range(len(feature_labels))[::-1]
+        pos = np.arange(len(feature_labels))[::-1]
         # specify the bar lengths
         val = scaled_importances
 
@@ -947,34 +985,19 @@ class ModelBase(backwards_compatible()):
             num_of_features = len(val)
 
         fig, ax = plt.subplots(1, 1, figsize=(14, 10))
-        # create separate plot for the case where num_of_features == 1
-        if num_of_features == 1:
-            plt.barh(pos[0:num_of_features], val[0:num_of_features], align="center",
-                     height=0.8, color="#1F77B4", edgecolor="none")
-            # Hide the right and top spines, color others grey
-            ax.spines["right"].set_visible(False)
-            ax.spines["top"].set_visible(False)
-            ax.spines["bottom"].set_color("#7B7B7B")
-            ax.spines["left"].set_color("#7B7B7B")
-            # Only show ticks on the left and bottom spines
-            ax.yaxis.set_ticks_position("left")
-            ax.xaxis.set_ticks_position("bottom")
-            plt.yticks(pos[0:num_of_features], feature_labels[0:num_of_features])
-            ax.margins(y=0.5)
-
-        else:
-            plt.barh(pos[0:num_of_features], val[0:num_of_features], align="center",
-                     height=0.8, color="#1F77B4", edgecolor="none")
-            # Hide the right and top spines, color others grey
-            ax.spines["right"].set_visible(False)
-            ax.spines["top"].set_visible(False)
-            ax.spines["bottom"].set_color("#7B7B7B")
-            ax.spines["left"].set_color("#7B7B7B")
-            # Only show ticks on the left and bottom spines
-            ax.yaxis.set_ticks_position("left")
-            ax.xaxis.set_ticks_position("bottom")
-            plt.yticks(pos[0:num_of_features], feature_labels[0:num_of_features])
-            ax.margins(y=0.5)
+        # the slices handle num_of_features == 1 just as well, so no special case is needed
+        plt.barh(pos[0:num_of_features], val[0:num_of_features], align="center",
+                 height=0.8, color="#1F77B4", edgecolor="none")
+        # Hide the right and top spines, color others grey
+        ax.spines["right"].set_visible(False)
+        ax.spines["top"].set_visible(False)
+        ax.spines["bottom"].set_color("#7B7B7B")
+        ax.spines["left"].set_color("#7B7B7B")
+        # Only show ticks on the left and bottom spines
+        ax.yaxis.set_ticks_position("left")
+        ax.xaxis.set_ticks_position("bottom")
+        plt.yticks(pos[0:num_of_features], feature_labels[0:num_of_features])
+        ax.margins(y=0.5)
 
         # check which algorithm was used to select right plot title
         if self._model_json["algo"] == "gbm":
@@ -1009,23 +1032,21 @@ class ModelBase(backwards_compatible()):
         plt = _get_matplotlib_pyplot(server)
         if not plt: return
 
-        # get unsorted tuple of labels and coefficients
-        unsorted_norm_coef = self.coef_norm().items()
-        # drop intercept value then sort tuples by the coefficient's absolute value
-        drop_intercept = [tup for tup in unsorted_norm_coef if tup[0] != "Intercept"]
-        norm_coef = sorted(drop_intercept, key=lambda x: abs(x[1]), reverse=True)
-
-        signage = []
-        for element in norm_coef:
-            # if positive including zero, color blue, else color orange (use same colors as Flow)
-            if element[1] >= 0:
-                signage.append("#1F77B4")  # blue
-            else:
-                signage.append("#FF7F0E")  # dark orange
+        import numpy as np
+        # drop the intercept, then order by the coefficient's absolute value with a single C-level argsort
+        # (stable, like the Python sort it replaces) instead of a tuple sort plus three more list passes
+        unsorted_norm_coef = list(self.coef_norm().items())
+        names = np.array([tup[0] for tup in unsorted_norm_coef if tup[0] != "Intercept"], dtype=object)
+        coefs = np.array([tup[1] for tup in unsorted_norm_coef if tup[0] != "Intercept"], dtype=np.float64)
+        order = np.argsort(-np.abs(coefs), kind="mergesort")
+        coefs = coefs[order]
+
+        # if positive including zero, color blue, else color orange (use same colors as Flow)
+        signage = np.where(coefs >= 0, "#1F77B4", "#FF7F0E").tolist()
 
         # get feature labels and their corresponding magnitudes
-        feature_labels = [tup[0] for tup in norm_coef]
-        norm_coef_magn = [abs(tup[1]) for tup in norm_coef]
+        feature_labels = names[order].tolist()
+        norm_coef_magn = np.abs(coefs)
         # specify bar centers on the y axis, but flip the order so largest bar appears at top
         pos = range(len(feature_labels))[::-1]
         # specify the bar lengths
@@ -1037,34 +1058,20 @@ class ModelBase(backwards_compatible()):
 
         # plot horizontal plot
         fig, ax = plt.subplots(1, 1, figsize=(14, 10))
-        # create separate plot for the case where num_of_features = 1
-        if num_of_features == 1:
-            plt.barh(pos[0], val[0],
-                     align="center", height=0.8, color=signage[0], edgecolor="none")
-            # Hide the right and top spines, color others grey
-            ax.spines["right"].set_visible(False)
-            ax.spines["top"].set_visible(False)
-            ax.spines["bottom"].set_color("#7B7B7B")
-            ax.spines["left"].set_color("#7B7B7B")
-            # Only show ticks on the left and bottom spines
-            ax.yaxis.set_ticks_position("left")
-            ax.xaxis.set_ticks_position("bottom")
-            plt.yticks([0], feature_labels[0])
-            ax.margins(y=0.5)
-
-        else:
-            plt.barh(pos[0:num_of_features], val[0:num_of_features],
-                     align="center", height=0.8, color=signage[0:num_of_features], edgecolor="none")
-            # Hide the right and top spines, color others grey
-            ax.spines["right"].set_visible(False)
-            ax.spines["top"].set_visible(False)
-            ax.spines["bottom"].set_color("#7B7B7B")
-            ax.spines["left"].set_color("#7B7B7B")
-            # Only show ticks on the left and bottom spines
-            ax.yaxis.set_ticks_position("left")
-            ax.xaxis.set_ticks_position("bottom")
-            plt.yticks(pos[0:num_of_features], feature_labels[0:num_of_features])
-            ax.margins(y=0.05)
+        # the slices handle num_of_features == 1 just as well, so no special case is needed (it also placed
+        # the y tick at 0 regardless of where the bar was drawn); only the margin differs for a single bar
+        plt.barh(pos[0:num_of_features], val[0:num_of_features],
+                 align="center", height=0.8, color=signage[0:num_of_features], edgecolor="none")
+        # Hide the right and top spines, color others grey
+        ax.spines["right"].set_visible(False)
+        ax.spines["top"].set_visible(False)
+        ax.spines["bottom"].set_color("#7B7B7B")
+        ax.spines["left"].set_color("#7B7B7B")
+        # Only show ticks on the left and bottom spines
+        ax.yaxis.set_ticks_position("left")
+        ax.xaxis.set_ticks_position("bottom")
+        plt.yticks(pos[0:num_of_features], feature_labels[0:num_of_features])
+        ax.margins(y=0.5 if num_of_features == 1 else 0.05)
 
         # generate custom fake lines that will be used as legend entries:
         # check if positive and negative values exist
@@ -1117,8 +1124,10 @@ class ModelBase(backwards_compatible()):
 
         :returns: None
         """
-        if len(y_actual) != len(y_predicted):
-            raise ValueError("Row mismatch: [{},{}]".format(len(y_actual), len(y_predicted)))
+        nrow_actual = y_actual.nrow
+        nrow_predicted = y_predicted.nrow
+        if nrow_actual != nrow_predicted:
+            raise ValueError("Row mismatch: [{},{}]".format(nrow_actual, nrow_predicted))
 
 
     def cross_validation_models(self):
@@ -1129,9 +1138,7 @@ class ModelBase(backwards_compatible()):
         """
         cvmodels = self._model_json["output"]["cross_validation_models"]
         if cvmodels is None: return None
-        m = []
-        for p in cvmodels: m.append(h2o.get_model(p["name"]))
-        return m
+        return _fetch_all(h2o.get_model, [p["name"] for p in cvmodels])
 
 
     def cross_validation_predictions(self):
@@ -1144,9 +1151,7 @@ class ModelBase(backwards_compatible()):
         """
         preds = self._model_json["output"]["cross_validation_predictions"]
         if preds is None: return None
-        m = []
-        for p in preds: m.append(h2o.get_frame(p["name"]))
-        return m
+        return _fetch_all(h2o.get_frame, [p["name"] for p in preds])
 
 
     def cross_validation_holdout_predictions(self):
@@ -1184,14 +1189,58 @@ class ModelBase(backwards_compatible()):
     }
 
 
+def _fetch_all(fetch, names):
+    """
+    Retrieve the named server objects through ``fetch`` (h2o.get_model / h2o.get_frame), concurrently.
+
+    Each fetch is a blocking HTTP round-trip during which the GIL is released, so dispatching them from a
+    thread pool overlaps the round-trips -- for a k-fold cross-validation that turns k serialized RTTs into
+    roughly one. Runs sequentially when ``concurrent.futures`` is unavailable.
+
+    :returns: a list of fetched objects, in the same order as ``names``.
+    """
+    if ThreadPoolExecutor is None or len(names) <= 1:
+        return [fetch(name) for name in names]
+    with ThreadPoolExecutor(max_workers=min(16, len(names))) as executor:
+        return list(executor.map(fetch, names))
+
+
+def _download_with_genmodel_jar(endpoint, path):
+    """
+    Download a model artifact to ``path`` while fetching h2o-genmodel.jar into the same folder.
+
+    Both responses are streamed straight to disk, and the jar is retrieved on a worker thread so that the
+    two transfers overlap (the GIL is released during socket reads). Falls back to sequential downloads
+    when ``concurrent.futures`` is unavailable.
+
+    :returns: location of the downloaded model artifact.
+    """
+    jar_path = os.path.join(path, "h2o-genmodel.jar")
+    if ThreadPoolExecutor is None:
+        h2o.api("GET /3/h2o-genmodel.jar", save_to=jar_path)
+        return h2o.api(endpoint, save_to=path)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        jar_job = executor.submit(h2o.api, "GET /3/h2o-genmodel.jar", save_to=jar_path)
+        filename = h2o.api(endpoint, save_to=path)
+        jar_job.result()
+    return filename
+
+
+_pyplot_cache = {}  # pyplot module memoized per `server` flag, so repeated plots skip the import machinery
+
 def _get_matplotlib_pyplot(server):
+    server = bool(server)
+    if server in _pyplot_cache:
+        return _pyplot_cache[server]
     try:
         # noinspection PyUnresolvedReferences
         import matplotlib
         if server: matplotlib.use("Agg", warn=False)
         # noinspection PyUnresolvedReferences
         import matplotlib.pyplot as plt
+        _pyplot_cache[server] = plt
         return plt
     except ImportError:
+        # not cached, so the hint is printed again on the next plotting attempt
         print("`matplotlib` library is required for this function!")
         return None
@@ -0,0 +1,25 @@
+from __future__ import print_function
+import sys
+sys.path.insert(1,"../../")
+import h2o
+from tests import pyunit_utils
+from h2o.estimators.gbm import H2OGradientBoostingEstimator
+
+def pyunit_predict_batch():
+    pros = h2o.import_file(pyunit_utils.locate("smalldata/prostate/prostate.csv"))
+    pros["CAPSULE"] = pros["CAPSULE"].asfactor()
+    m = H2OGradientBoostingEstimator(ntrees=10)
+    m.train(x=list(range(2, pros.ncol)), y="CAPSULE", training_frame=pros)
+
+    frames = [pros[:100, :], pros[100:200, :], pros[200:, :]]
+    batched = m.predict_batch(frames)
+    assert len(batched) == len(frames)
+    for fr, pred in zip(frames, batched):
+        assert pred.nrow == fr.nrow
+        single = m.predict(fr)
+        assert pyunit_utils.compare_frames(single, pred, numElements=pred.nrow)
+
+if __name__ == "__main__":
+  pyunit_utils.standalone_test(pyunit_predict_batch)
+else:
+  pyunit_predict_batch()